@@ -4,9 +4,8 @@ Support for prepared statements
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
-from enum import IntEnum, auto
-from typing import Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
-from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
+from itertools import islice
 
 from .pq import ExecStatus
 from ._compat import Deque
@@ -16,45 +15,101 @@ if TYPE_CHECKING:
     from .pq.abc import PGresult
 
 
-class Prepare(IntEnum):
-    NO = auto()
-    YES = auto()
-    SHOULD = auto()
+class Prepare:
+    # Values returned by PrepareManager.get(). They are plain ints rather than
+    # an enum because they are accessed and compared for every query.
+    NO = 1
+    YES = 2
+    SHOULD = 3
 
 
 Key = Tuple[bytes, Tuple[int, ...]]
 
+COMMAND_OK = ExecStatus.COMMAND_OK
+TUPLES_OK = ExecStatus.TUPLES_OK
+
+# Maximum number of least recently used statements among which to choose the
+# one to deallocate.
+_EVICT_CANDIDATES = 25
+
+# Value at which the usage counter of a prepared statement saturates.
+_MAX_HITS = 0xFFFF
+
+# Cache of the prepared statements names, shared by all the connections.
+# Filled lazily, bounded to the first _MAX_NAMES indexes.
+_names_cache: Dict[int, bytes] = {}
+_MAX_NAMES = 1024
+
 
 class PrepareManager:
     # Number of times a query is executed before it is prepared.
-    prepare_threshold: Optional[int] = 5
+    _prepare_threshold: Optional[int] = 5
 
     # Maximum number of prepared statements on the connection.
     prepared_max: int = 100
 
+    # Maximum total size of the queries of the prepared statements.
+    prepared_max_bytes: int = 8 * 1024 * 1024
+
     def __init__(self) -> None:
         # Map (query, types) to the number of times the query was seen.
-        self._counts: OrderedDict[Key, int] = OrderedDict()
+        # Plain dicts preserve insertion order: the first item is the least
+        # recently used, which is what we evict in _rotate().
+        self._counts: Dict[Key, int] = {}
 
         # Map (query, types) to the name of the statement if  prepared.
-        self._names: OrderedDict[Key, bytes] = OrderedDict()
+        self._names: Dict[Key, bytes] = {}
+
+        # Map (query, types) to the number of times a prepared statement was
+        # used. Missing if never used after being prepared.
+        self._hits: Dict[Key, int] = {}
+
+        # Total size of the queries in _names.
+        self._total_bytes = 0
+
+        # Number of statements deallocated since the hits were last aged.
+        self._evicted = 0
 
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
         self._maint_commands = Deque[bytes]()
 
+    @property
+    def prepare_threshold(self) -> Optional[int]:
+        return self._prepare_threshold
+
+    @prepare_threshold.setter
+    def prepare_threshold(self, value: Optional[int]) -> None:
+        self._prepare_threshold = value
+
+        # If prepared statements are disabled, shortcut the methods called
+        # for every query executed; restore them if they are enabled again.
+        if value is None:
+            self.get = _get_disabled  # type: ignore[assignment]
+            self.maybe_add_to_cache = (  # type: ignore[assignment]
+                _maybe_add_to_cache_disabled
+            )
+        else:
+            self.__dict__.pop("get", None)
+            self.__dict__.pop("maybe_add_to_cache", None)
+
     @staticmethod
     def key(query: PostgresQuery) -> Key:
-        return (query.query, query.types)
+        # The key is requested more than once for every query executed:
+        # cache it on the query, which resets it when the types change.
+        key = query._key
+        if key is None:
+            key = query._key = (query.query, query.types)
+        return key
 
     def get(
         self, query: PostgresQuery, prepare: Optional[bool] = None
-    ) -> Tuple[Prepare, bytes]:
+    ) -> Tuple[int, bytes]:
         """
         Check if a query is prepared, tell back whether to prepare it.
         """
-        if prepare is False or self.prepare_threshold is None:
+        if prepare is False:
             # The user doesn't want this query to be prepared
             return Prepare.NO, b""
 
@@ -64,18 +119,28 @@ class PrepareManager:
             # The query was already prepared in this session
             return Prepare.YES, name
 
+        # The threshold is not None: get() is replaced if it's disabled.
         count = self._counts.get(key, 0)
-        if count >= self.prepare_threshold or prepare:
+        if count >= self._prepare_threshold or prepare:  # type: ignore
+            if len(key[0]) > self.prepared_max_bytes:
+                # The query would be deallocated as soon as prepared
+                return Prepare.NO, b""
+
             # The query has been executed enough times and needs to be prepared
-            name = f"_pg3_{self._prepared_idx}".encode()
+            idx = self._prepared_idx
             self._prepared_idx += 1
+            name = _names_cache.get(idx)
+            if not name:
+                name = f"_pg3_{idx}".encode()
+                if idx < _MAX_NAMES:
+                    _names_cache[idx] = name
             return Prepare.SHOULD, name
         else:
             # The query is not to be prepared yet
             return Prepare.NO, b""
 
     def _should_discard(
-        self, prep: Prepare, results: Sequence["PGresult"]
+        self, prep: int, results: Sequence["PGresult"]
     ) -> bool:
         """Check if we need to discard our entire state: it should happen on
         rollback or on dropping objects, because the same object may get
@@ -83,7 +148,7 @@ class PrepareManager:
         """
         if self._names or prep == Prepare.SHOULD:
             for result in results:
-                if result.status != ExecStatus.COMMAND_OK:
+                if result.status != COMMAND_OK:
                     continue
                 cmdstat = result.command_status
                 if cmdstat and (
@@ -100,7 +165,7 @@ class PrepareManager:
             return False
 
         status = results[0].status
-        if ExecStatus.COMMAND_OK != status != ExecStatus.TUPLES_OK:
+        if status != COMMAND_OK and status != TUPLES_OK:
             # We don't prepare failed queries or other weird results
             return False
 
@@ -110,17 +175,47 @@ class PrepareManager:
         """Evict an old value from the cache.
 
         If it was prepared, deallocate it. Do it only once: if the cache was
-        resized, deallocate gradually.
+        resized, deallocate gradually. However deallocate as many statements
+        as needed to fit the queries in `prepared_max_bytes`.
         """
         if len(self._counts) > self.prepared_max:
-            self._counts.popitem(last=False)
+            del self._counts[next(iter(self._counts))]
 
         if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
-            self._maint_commands.append(b"DEALLOCATE " + name)
+            self._deallocate(self._evict_candidate())
+
+        while self._total_bytes > self.prepared_max_bytes and self._names:
+            self._deallocate(self._evict_candidate())
+
+    def _deallocate(self, key: Key) -> None:
+        """Remove a prepared statement and schedule its deallocation."""
+        name = self._names.pop(key)
+        self._total_bytes -= len(key[0])
+        self._hits.pop(key, None)
+        self._maint_commands.append(b"DEALLOCATE " + name)
+
+        # Age the usage counters, so that statements used often in the
+        # past don't stick around forever.
+        self._evicted += 1
+        if self._evicted >= self.prepared_max:
+            self._evicted = 0
+            hits = self._hits
+            for k in hits:
+                hits[k] >>= 1
+
+    def _evict_candidate(self) -> Key:
+        """Return the key of the prepared statement to deallocate.
+
+        Choose the least used among the oldest quarter of the statements (the
+        oldest if tied), so that a stream of queries executed just enough to
+        be prepared doesn't push out the statements used often.
+        """
+        ncands = min(max(len(self._names) // 4, 1), _EVICT_CANDIDATES)
+        hits = self._hits
+        return min(islice(self._names, ncands), key=lambda k: hits.get(k, 0))
 
     def maybe_add_to_cache(
-        self, query: PostgresQuery, prep: Prepare, name: bytes
+        self, query: PostgresQuery, prep: int, name: bytes
     ) -> Optional[Key]:
         """Handle 'query' for possible addition to the cache.
 
@@ -129,35 +224,37 @@ class PrepareManager:
 
         Note: This method is only called in pipeline mode.
         """
-        # don't do anything if prepared statements are disabled
-        if self.prepare_threshold is None:
-            return None
-
+        # Popping and re-inserting the entries moves them to the end (most
+        # recently used) and spares a lookup to check if they are there.
         key = self.key(query)
-        if key in self._counts:
-            if prep is Prepare.SHOULD:
-                del self._counts[key]
+        count = self._counts.pop(key, 0)
+        if count:
+            if prep == Prepare.SHOULD:
                 self._names[key] = name
+                self._total_bytes += len(key[0])
             else:
-                self._counts[key] += 1
-                self._counts.move_to_end(key)
+                self._counts[key] = count + 1
             return None
 
-        elif key in self._names:
-            self._names.move_to_end(key)
+        prepared = self._names.pop(key, None)
+        if prepared:
+            self._names[key] = prepared
+            hits = self._hits.get(key, 0)
+            if hits < _MAX_HITS:
+                self._hits[key] = hits + 1
             return None
 
+        if prep == Prepare.SHOULD:
+            self._names[key] = name
+            self._total_bytes += len(key[0])
         else:
-            if prep is Prepare.SHOULD:
-                self._names[key] = name
-            else:
-                self._counts[key] = 1
-            return key
+            self._counts[key] = 1
+        return key
 
     def validate(
         self,
         key: Key,
-        prep: Prepare,
+        prep: int,
         name: bytes,
         results: Sequence["PGresult"],
     ) -> None:
@@ -171,7 +268,9 @@ class PrepareManager:
             return
 
         if not self._check_results(results):
-            self._names.pop(key, None)
+            if self._names.pop(key, None):
+                self._total_bytes -= len(key[0])
+            self._hits.pop(key, None)
             self._counts.pop(key, None)
         else:
             self._rotate()
@@ -183,6 +282,9 @@ class PrepareManager:
         the server.
         """
         self._counts.clear()
+        self._hits.clear()
+        self._evicted = 0
+        self._total_bytes = 0
         if self._names:
             self._names.clear()
             self._maint_commands.clear()
@@ -195,5 +297,22 @@ class PrepareManager:
         """
         Iterate over the commands needed to align the server state to our state
         """
-        while self._maint_commands:
-            yield self._maint_commands.popleft()
+        if self._maint_commands:
+            # Send all the pending commands to the server in a single query
+            cmd = b"; ".join(self._maint_commands)
+            self._maint_commands.clear()
+            yield cmd
+
+
+def _get_disabled(
+    query: PostgresQuery, prepare: Optional[bool] = None
+) -> Tuple[int, bytes]:
+    """Implementation of `PrepareManager.get()` if preparation is disabled."""
+    return Prepare.NO, b""
+
+
+def _maybe_add_to_cache_disabled(
+    query: PostgresQuery, prep: int, name: bytes
+) -> Optional[Key]:
+    """Implementation of `PrepareManager.maybe_add_to_cache()` if disabled."""
+    return None
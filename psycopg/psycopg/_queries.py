@@ -33,7 +33,7 @@ class PostgresQuery:
 
     __slots__ = """
         query params types formats
-        _tx _want_formats _parts _encoding _order
+        _tx _want_formats _parts _encoding _order _key
         """.split()
 
     def __init__(self, transformer: "Transformer"):
@@ -52,6 +52,10 @@ class PostgresQuery:
         self._encoding = "utf-8"
         self._order: Optional[List[str]] = None
 
+        # The (query, types) pair used as key by the prepared statements
+        # manager; computed lazily and reset every time the types change.
+        self._key: Optional[Tuple[bytes, Tuple[int, ...]]] = None
+
         conn = transformer.connection
         if conn:
             self._encoding = pgconn_encoding(conn.pgconn)
@@ -89,6 +93,7 @@ class PostgresQuery:
 
         This method updates `params` and `types`.
         """
+        self._key = None
         if vars is not None:
             params = _validate_and_reorder_params(
                 self._parts, vars, self._order
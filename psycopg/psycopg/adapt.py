@@ -58,9 +58,8 @@ class Dumper(abc.Dumper, ABC):
         value = self.dump(obj)
 
         if self.connection:
-            esc = pq.Escaping(self.connection.pgconn)
             # escaping and quoting
-            return esc.escape_literal(value)
+            return self.connection._escaping.escape_literal(value)
 
         # This path is taken when quote is asked without a connection,
         # usually it means by psycopg.sql.quote() or by
@@ -37,7 +37,7 @@ from .transaction import Transaction
 from .server_cursor import ServerCursor
 
 if TYPE_CHECKING:
-    from .pq.abc import PGconn, PGresult
+    from .pq.abc import Escaping, PGconn, PGresult
     from psycopg_pool.base import BasePool
 
 logger = logging.getLogger("psycopg")
@@ -115,6 +115,9 @@ class BaseConnection(Generic[Row]):
 
         self._closed = False  # closed by an explicit close()
         self._prepared: PrepareManager = PrepareManager()
+
+        # Shared by the adapters which need to escape data on the connection
+        self._escaping: "Escaping" = pq.Escaping(pgconn)
         self._tpc: Optional[Tuple[Xid, bool]] = None  # xid, prepared
 
         wself = ref(self)
@@ -377,6 +380,19 @@ class BaseConnection(Generic[Row]):
     def prepared_max(self, value: int) -> None:
         self._prepared.prepared_max = value
 
+    @property
+    def prepared_max_bytes(self) -> int:
+        """
+        Maximum total size, in bytes, of the prepared statements queries.
+
+        Default value: 8 MiB
+        """
+        return self._prepared.prepared_max_bytes
+
+    @prepared_max_bytes.setter
+    def prepared_max_bytes(self, value: int) -> None:
+        self._prepared.prepared_max_bytes = value
+
     # Generators to perform high-level operations on the connection
     #
     # These operations are expressed in terms of non-blocking generators
@@ -246,11 +246,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
     ) -> PQGen[List["PGresult"]]:
         # Check if the query is prepared or needs preparing
         prep, name = self._conn._prepared.get(pgq, prepare)
-        if prep is Prepare.YES:
+        if prep == Prepare.YES:
             # The query is already prepared
             self._send_query_prepared(name, pgq, binary=binary)
 
-        elif prep is Prepare.NO:
+        elif prep == Prepare.NO:
             # The query must be executed without preparing
             self._execute_send(pgq, binary=binary)
 
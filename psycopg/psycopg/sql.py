@@ -9,7 +9,6 @@ import string
 from abc import ABC, abstractmethod
 from typing import Any, Iterator, Iterable, List, Optional, Sequence, Union
 
-from .pq import Escaping
 from .abc import AdaptContext
 from .adapt import Transformer, PyFormat
 from ._encodings import pgconn_encoding
@@ -366,7 +365,7 @@ class Identifier(Composable):
         conn = context.connection if context else None
         if not conn:
             raise ValueError("a connection is necessary for Identifier")
-        esc = Escaping(conn.pgconn)
+        esc = conn._escaping
         enc = pgconn_encoding(conn.pgconn)
         escs = [esc.escape_identifier(s.encode(enc)) for s in self._obj]
         return b".".join(escs)
@@ -4,7 +4,7 @@ Adapters for textual types.
 
 # Copyright (C) 2020-2021 The Psycopg Team
 
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Callable, Optional, Union, TYPE_CHECKING
 
 from .. import postgres
 from ..pq import Format, Escaping
@@ -16,6 +16,9 @@ from .._encodings import pgconn_encoding
 if TYPE_CHECKING:
     from ..pq.abc import Escaping as EscapingProto
 
+# Used to escape data when no connection is available.
+_no_conn_escaping = Escaping()
+
 
 class _BaseStrDumper(Dumper):
 
@@ -36,19 +39,54 @@ class StrBinaryDumper(_BaseStrDumper):
     format = Format.BINARY
     oid = postgres.types["text"].oid
 
+    def __init__(self, cls: type, context: Optional[AdaptContext] = None):
+        super().__init__(cls, context)
+        self._dump = self._make_dump(self._encoding)
+
+        # Replace dump() with the function bound to the encoding, which saves
+        # an attribute lookup for every string dumped. Don't do it if a
+        # subclass has customised dump().
+        if type(self).dump is StrBinaryDumper.dump:
+            self.dump = self._dump  # type: ignore[assignment]
+
     def dump(self, obj: str) -> bytes:
-        # the server will raise DataError subclass if the string contains 0x00
-        return obj.encode(self._encoding)
+        return self._dump(obj)
+
+    @staticmethod
+    def _make_dump(encoding: str) -> Callable[[str], bytes]:
+        def dump(obj: str) -> bytes:
+            # the server will raise DataError subclass if the string contains
+            # 0x00
+            return obj.encode(encoding)
+
+        return dump
 
 
 class _StrDumper(_BaseStrDumper):
+    def __init__(self, cls: type, context: Optional[AdaptContext] = None):
+        super().__init__(cls, context)
+        self._dump = self._make_dump(self._encoding)
+
+        # Replace dump() with the function bound to the encoding, unless a
+        # subclass has customised it.
+        if type(self).dump is _StrDumper.dump:
+            self.dump = self._dump  # type: ignore[assignment]
+
     def dump(self, obj: str) -> bytes:
-        if "\x00" in obj:
-            raise DataError(
-                "PostgreSQL text fields cannot contain NUL (0x00) bytes"
-            )
-        else:
-            return obj.encode(self._encoding)
+        return self._dump(obj)
+
+    @staticmethod
+    def _make_dump(encoding: str) -> Callable[[str], bytes]:
+        def dump(obj: str) -> bytes:
+            # Check for 0 after encoding: searching bytes is faster than str
+            rv = obj.encode(encoding)
+            if b"\x00" in rv:
+                raise DataError(
+                    "PostgreSQL text fields cannot contain NUL (0x00) bytes"
+                )
+            return rv
+
+        return dump
 
 
 class StrDumper(_StrDumper):
@@ -89,15 +127,34 @@ class TextLoader(Loader):
             enc = pgconn_encoding(conn.pgconn)
             self._encoding = enc if enc != "ascii" else ""
 
+        self._load = self._make_load(self._encoding)
+
+        # Replace load() with the function specialised on the encoding, which
+        # saves the checks for every value loaded. Don't do it if a subclass
+        # has customised load().
+        if type(self).load is TextLoader.load:
+            self.load = self._load  # type: ignore[assignment]
+
     def load(self, data: Buffer) -> Union[bytes, str]:
-        if self._encoding:
-            if isinstance(data, memoryview):
-                return bytes(data).decode(self._encoding)
-            else:
-                return data.decode(self._encoding)
+        return self._load(data)
+
+    @staticmethod
+    def _make_load(encoding: str) -> Callable[[Buffer], Union[bytes, str]]:
+        if encoding:
+
+            def load(data: Buffer) -> Union[bytes, str]:
+                if isinstance(data, memoryview):
+                    # decode the buffer directly, without copying it into bytes
+                    return str(data, encoding)
+                else:
+                    return data.decode(encoding)
+
         else:
             # return bytes for SQL_ASCII db
-            return data
+            def load(data: Buffer) -> Union[bytes, str]:
+                return data
+
+        return load
 
 
 class TextBinaryLoader(TextLoader):
@@ -112,9 +169,8 @@ class BytesDumper(Dumper):
 
     def __init__(self, cls: type, context: Optional[AdaptContext] = None):
         super().__init__(cls, context)
-        self._esc = Escaping(
-            self.connection.pgconn if self.connection else None
-        )
+        conn = self.connection
+        self._esc = conn._escaping if conn else _no_conn_escaping
 
     def dump(self, obj: bytes) -> Buffer:
         return self._esc.escape_bytea(obj)
@@ -156,12 +212,7 @@ class BytesBinaryDumper(Dumper):
 
 class ByteaLoader(Loader):
 
-    _escaping: "EscapingProto"
-
-    def __init__(self, oid: int, context: Optional[AdaptContext] = None):
-        super().__init__(oid, context)
-        if not hasattr(self.__class__, "_escaping"):
-            self.__class__._escaping = Escaping()
+    _escaping: "EscapingProto" = _no_conn_escaping
 
     def load(self, data: Buffer) -> bytes:
         return self._escaping.unescape_bytea(data)
@@ -3,27 +3,65 @@ import importlib
 import ipaddress
 from math import isnan
 from uuid import UUID
-from random import choice, random, randrange
+from random import choice, choices, getrandbits, random, randrange
 from decimal import Decimal
+from functools import lru_cache, wraps
 from contextlib import contextmanager
-from typing import Any, List, Set, Tuple, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 import pytest
 
 import psycopg
 from psycopg import sql
 from psycopg.adapt import PyFormat
-from psycopg._compat import asynccontextmanager, Deque
+from psycopg._compat import asynccontextmanager
 from psycopg.types.range import Range
 from psycopg.types.numeric import Int4, Int8
 from psycopg.types.multirange import Multirange
 
+_DIGITS = "0123456789"
+
+# Maximum number of parameters of a query: the protocol counts them in 16 bits
+_MAX_PARAMS = 65535
+_BOOLS = (True, False)
+_FLOAT_SPECIALS = (0.0, -0.0, float("-inf"), float("inf"), float("nan"))
+_TIMEDELTA_BOUNDS = (dt.timedelta.min, dt.timedelta.max)
+
+# Add a day to the minimum because with timezone we might go BC
+_DATETIME_MIN = dt.datetime.min + dt.timedelta(days=1)
+_DATETIME_MICROS = (
+    ((dt.datetime.max - _DATETIME_MIN).days + 1) * 24 * 60 * 60 * 1_000_000
+)
+
+# All the timezones with an offset within +/- 12 hours, by the minute
+_TIMEZONES = tuple(
+    dt.timezone(dt.timedelta(minutes=m)) for m in range(-12 * 60, 12 * 60 + 1)
+)
+
 
 @pytest.fixture
 def faker(conn):
     return Faker(conn)
 
 
+def cached(f):
+    """
+    Property caching its value until the Faker schema or format change.
+    """
+    name = f.__name__
+
+    @property  # type: ignore[misc]
+    @wraps(f)
+    def cached_(self):
+        try:
+            return self._cache[name]
+        except KeyError:
+            rv = self._cache[name] = f(self)
+            return rv
+
+    return cached_
+
+
 class Faker:
     """
     An object to generate random records.
@@ -37,15 +75,25 @@ class Faker:
 
     def __init__(self, connection):
         self.conn = connection
-        self.format = PyFormat.BINARY
+        self._format = PyFormat.BINARY
         self.records = []
 
         self._schema = None
-        self._types = None
-        self._types_names = None
-        self._makers = {}
+        self._methods: Dict[Tuple[str, type], Any] = {}
         self.table_name = sql.Identifier("fake_table")
 
+        # Values depending on the schema and the format, e.g. the statements
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def format(self):
+        return self._format
+
+    @format.setter
+    def format(self, format):
+        self._format = format
+        self._cache.clear()
+
     @property
     def schema(self):
         if not self._schema:
@@ -55,37 +103,33 @@ class Faker:
     @schema.setter
     def schema(self, schema):
         self._schema = schema
-        self._types_names = None
+        self._cache.clear()
 
-    @property
+    @cached
     def fields_names(self):
-        return [sql.Identifier(f"fld_{i}") for i in range(len(self.schema))]
+        return tuple(
+            sql.Identifier(f"fld_{i}") for i in range(len(self.schema))
+        )
 
-    @property
+    @cached
     def types(self):
-        if not self._types:
+        def key(cls: type) -> str:
+            return cls.__name__
 
-            def key(cls: type) -> str:
-                return cls.__name__
+        return sorted(self.get_supported_types(), key=key)
 
-            self._types = sorted(self.get_supported_types(), key=key)
-        return self._types
-
-    @property
+    @cached
     def types_names_sql(self):
-        if self._types_names:
-            return self._types_names
-
-        record = self.make_record(nulls=0)
+        # Columns with the same spec have the same type: look it up once
         tx = psycopg.adapt.Transformer(self.conn)
-        types = [
-            self._get_type_name(tx, schema, value)
-            for schema, value in zip(self.schema, record)
-        ]
-        self._types_names = types
-        return types
+        names: Dict[Any, sql.Composable] = {}
+        for spec in self.schema:
+            if spec not in names:
+                names[spec] = self._get_type_name(tx, spec, self.example(spec))
 
-    @property
+        return [names[spec] for spec in self.schema]
+
+    @cached
     def types_names(self):
         types = [
             t.as_string(self.conn).replace('"', "")
@@ -107,40 +151,109 @@ class Faker:
         else:
             return sql.Identifier(info.name)
 
-    @property
+    @cached
     def drop_stmt(self):
         return sql.SQL("drop table if exists {}").format(self.table_name)
 
-    @property
+    @cached
     def create_stmt(self):
-        field_values = []
-        for name, type in zip(self.fields_names, self.types_names_sql):
-            field_values.append(sql.SQL("{} {}").format(name, type))
-
-        fields = sql.SQL(", ").join(field_values)
+        space = sql.SQL(" ")
+        fields = sql.SQL(", ").join(
+            [
+                sql.Composed([name, space, type])
+                for name, type in zip(self.fields_names, self.types_names_sql)
+            ]
+        )
         return sql.SQL(
             "create table {table} (id serial primary key, {fields})"
         ).format(table=self.table_name, fields=fields)
 
-    @property
+    @cached
     def insert_stmt(self):
-        phs = [
-            sql.Placeholder(format=self.format)
-            for i in range(len(self.schema))
-        ]
-        return sql.SQL("insert into {} ({}) values ({})").format(
+        return sql.SQL("insert into {} ({}) values {}").format(
             self.table_name,
             sql.SQL(", ").join(self.fields_names),
-            sql.SQL(", ").join(phs),
+            self._values_row,
         )
 
-    @property
+    @cached
     def select_stmt(self):
         fields = sql.SQL(", ").join(self.fields_names)
         return sql.SQL("select {} from {} order by id").format(
             fields, self.table_name
         )
 
+    @cached
+    def copy_stmt(self):
+        fmt = "binary" if self.format == PyFormat.BINARY else "text"
+        return sql.SQL("copy {} ({}) from stdin (format {})").format(
+            self.table_name,
+            sql.SQL(", ").join(self.fields_names),
+            sql.SQL(fmt),
+        )
+
+    @cached
+    def _values_row(self):
+        ph = sql.Placeholder(format=self.format)
+        return sql.SQL("({})").format(
+            sql.SQL(", ").join([ph] * len(self.schema))
+        )
+
+    @cached
+    def _bulk_size(self):
+        # Number of records fitting in the parameters of a single statement
+        return _MAX_PARAMS // len(self.schema)
+
+    @cached
+    def _bulk_insert_full_stmt(self):
+        return self._bulk_insert_stmt(self._bulk_size)
+
+    def _bulk_insert_stmt(self, nrecs):
+        return sql.SQL("insert into {} ({}) values {}").format(
+            self.table_name,
+            sql.SQL(", ").join(self.fields_names),
+            sql.SQL(", ").join([self._values_row] * nrecs),
+        )
+
+    def _bulk_insert_batches(self):
+        """Return the statements and parameters to insert the records."""
+        size = self._bulk_size
+        rv = []
+        for i in range(0, len(self.records), size):
+            recs = self.records[i : i + size]
+            if len(recs) == size:
+                stmt = self._bulk_insert_full_stmt
+            else:
+                stmt = self._bulk_insert_stmt(len(recs))
+            rv.append((stmt, [val for rec in recs for val in rec]))
+        return rv
+
+    def bulk_insert(self, cur):
+        """Insert all the records in the table in as few statements as possible."""
+        with self.find_insert_problem(cur.connection):
+            for stmt, params in self._bulk_insert_batches():
+                cur.execute(stmt, params)
+
+    async def bulk_insert_async(self, acur):
+        async with self.find_insert_problem_async(acur.connection):
+            for stmt, params in self._bulk_insert_batches():
+                await acur.execute(stmt, params)
+
+    def copy_insert(self, cur, set_types=True):
+        """Insert all the records in the table using COPY."""
+        with cur.copy(self.copy_stmt) as copy:
+            if set_types:
+                copy.set_types(self.types_names)
+            for rec in self.records:
+                copy.write_row(rec)
+
+    async def copy_insert_async(self, acur, set_types=True):
+        async with acur.copy(self.copy_stmt) as copy:
+            if set_types:
+                copy.set_types(self.types_names)
+            for rec in self.records:
+                await copy.write_row(rec)
+
     @contextmanager
     def find_insert_problem(self, conn):
         """Context manager to help finding a problematic vaule."""
@@ -152,18 +265,20 @@ class Faker:
             # Repeat insert one field at time, until finding the wrong one
             cur.execute(self.drop_stmt)
             cur.execute(self.create_stmt)
-            for i, rec in enumerate(self.records):
-                for j, val in enumerate(rec):
+            for j, stmt, col in self._insert_columns():
+                # Try the whole column first, look for the value if it fails
+                try:
+                    with conn.transaction():
+                        cur.executemany(stmt, [(val,) for val in col])
+                    continue
+                except psycopg.DatabaseError:
+                    pass
+
+                for i, val in enumerate(col):
                     try:
-                        cur.execute(self._insert_field_stmt(j), (val,))
+                        cur.execute(stmt, (val,))
                     except psycopg.DatabaseError as e:
-                        r = repr(val)
-                        if len(r) > 200:
-                            r = f"{r[:200]}... ({len(r)} chars)"
-                        raise Exception(
-                            f"value {r!r} at record {i} column0 {j}"
-                            f" failed insert: {e}"
-                        ) from None
+                        raise self._insert_problem(i, j, val, e) from None
 
             # just in case, but hopefully we should have triggered the problem
             raise
@@ -178,28 +293,49 @@ class Faker:
             # Repeat insert one field at time, until finding the wrong one
             await acur.execute(self.drop_stmt)
             await acur.execute(self.create_stmt)
-            for i, rec in enumerate(self.records):
-                for j, val in enumerate(rec):
+            for j, stmt, col in self._insert_columns():
+                # Try the whole column first, look for the value if it fails
+                try:
+                    async with aconn.transaction():
+                        await acur.executemany(stmt, [(val,) for val in col])
+                    continue
+                except psycopg.DatabaseError:
+                    pass
+
+                for i, val in enumerate(col):
                     try:
-                        await acur.execute(self._insert_field_stmt(j), (val,))
+                        await acur.execute(stmt, (val,))
                     except psycopg.DatabaseError as e:
-                        r = repr(val)
-                        if len(r) > 200:
-                            r = f"{r[:200]}... ({len(r)} chars)"
-                        raise Exception(
-                            f"value {r!r} at record {i} column0 {j}"
-                            f" failed insert: {e}"
-                        ) from None
+                        raise self._insert_problem(i, j, val, e) from None
 
             # just in case, but hopefully we should have triggered the problem
             raise
 
-    def _insert_field_stmt(self, i):
-        ph = sql.Placeholder(format=self.format)
-        return sql.SQL("insert into {} ({}) values ({})").format(
-            self.table_name, self.fields_names[i], ph
+    def _insert_columns(self):
+        """Return the index, insert statement and values of each column."""
+        stmts = self._insert_field_stmts
+        return [(j, stmts[j], col) for j, col in enumerate(zip(*self.records))]
+
+    @staticmethod
+    def _insert_problem(i, j, val, e):
+        """Return an exception describing an insert failure."""
+        r = repr(val)
+        if len(r) > 200:
+            r = f"{r[:200]}... ({len(r)} chars)"
+        return Exception(
+            f"value {r!r} at record {i} column0 {j} failed insert: {e}"
         )
 
+    @cached
+    def _insert_field_stmts(self):
+        ph = sql.Placeholder(format=self.format)
+        return [
+            sql.SQL("insert into {} ({}) values ({})").format(
+                self.table_name, name, ph
+            )
+            for name in self.fields_names
+        ]
+
     def choose_schema(self, ncols=20):
         schema: List[Union[Tuple[type, ...], type]] = []
         while len(schema) < ncols:
@@ -213,20 +349,32 @@ class Faker:
 
     def make_record(self, nulls=0):
         if not nulls:
-            return tuple(self.example(spec) for spec in self.schema)
+            example = self.example
+            return tuple([example(spec) for spec in self.schema])
         else:
             return tuple(
-                self.make(spec) if random() > nulls else None
-                for spec in self.schema
+                [
+                    make(spec) if random() > nulls else None
+                    for make, spec in zip(self._schema_makers, self.schema)
+                ]
             )
 
     def assert_record(self, got, want):
-        for spec, g, w in zip(self.schema, got, want):
+        for m, spec, g, w in zip(
+            self._schema_matchers, self.schema, got, want
+        ):
             if g is None and w is None:
                 continue
-            m = self.get_matcher(spec)
             m(spec, g, w)
 
+    @cached
+    def _schema_makers(self):
+        return [self.get_maker(spec) for spec in self.schema]
+
+    @cached
+    def _schema_matchers(self):
+        return [self.get_matcher(spec) for spec in self.schema]
+
     def get_supported_types(self) -> Set[type]:
         dumpers = self.conn.adapters._dumpers[self.format]
         rv = set()
@@ -265,15 +413,8 @@ class Faker:
 
     def get_maker(self, spec):
         cls = spec if isinstance(spec, type) else spec[0]
-
-        try:
-            return self._makers[cls]
-        except KeyError:
-            pass
-
         meth = self._get_method("make", cls)
         if meth:
-            self._makers[cls] = meth
             return meth
         else:
             raise NotImplementedError(
@@ -286,6 +427,13 @@ class Faker:
         return meth if meth else self.match_any
 
     def _get_method(self, prefix, cls):
+        try:
+            return self._methods[prefix, cls]
+        except KeyError:
+            meth = self._methods[prefix, cls] = self._find_method(prefix, cls)
+            return meth
+
+    def _find_method(self, prefix, cls):
         name = cls.__name__
         if cls.__module__ != "builtins":
             name = f"{cls.__module__}.{name}"
@@ -324,14 +472,14 @@ class Faker:
         return want.obj == got
 
     def make_bool(self, spec):
-        return choice((True, False))
+        return choice(_BOOLS)
 
     def make_bytearray(self, spec):
         return self.make_bytes(spec)
 
     def make_bytes(self, spec):
         length = randrange(self.str_max_length)
-        return spec(bytes([randrange(256) for i in range(length)]))
+        return spec(randbytes(length))
 
     def make_date(self, spec):
         day = randrange(dt.date.max.toordinal())
@@ -341,11 +489,8 @@ class Faker:
         return self.schema_time(cls)
 
     def make_datetime(self, spec):
-        # Add a day because with timezone we might go BC
-        dtmin = dt.datetime.min + dt.timedelta(days=1)
-        delta = dt.datetime.max - dtmin
-        micros = randrange((delta.days + 1) * 24 * 60 * 60 * 1_000_000)
-        rv = dtmin + dt.timedelta(microseconds=micros)
+        micros = randrange(_DATETIME_MICROS)
+        rv = _DATETIME_MIN + dt.timedelta(microseconds=micros)
         if spec[1]:
             rv = rv.replace(tzinfo=self._make_tz(spec))
         return rv
@@ -363,16 +508,17 @@ class Faker:
             else:
                 return Decimal(choice(["NaN", "sNaN"]))
 
+        def digits(c):
+            # Expand z into zeros, d into random digits
+            if c == "z":
+                return "0" * randrange(1, 20)
+            elif c == "d":
+                return "".join(choices(_DIGITS, k=randrange(1, 20)))
+            else:
+                return c
+
         sign = choice("+-")
-        num = choice(["0.zd", "d", "d.d"])
-        while "z" in num:
-            ndigits = randrange(1, 20)
-            num = num.replace("z", "0" * ndigits, 1)
-        while "d" in num:
-            ndigits = randrange(1, 20)
-            num = num.replace(
-                "d", "".join([str(randrange(10)) for i in range(ndigits)]), 1
-            )
+        num = "".join([digits(c) for c in choice(["0.zd", "d", "d.d"])])
         expsign = choice(["e+", "e-", ""])
         exp = randrange(20) if expsign else ""
         rv = Decimal(f"{sign}{num}{expsign}{exp}")
@@ -393,9 +539,7 @@ class Faker:
                 else f"{choice('-+')}0.{randrange(1 << 22)}e{randrange(-37,38)}"
             )
         else:
-            return choice(
-                (0.0, -0.0, float("-inf"), float("inf"), float("nan"))
-            )
+            return choice(_FLOAT_SPECIALS)
 
     def match_float(self, spec, got, want, approx=False, rel=None):
         if got is not None and isnan(got):
@@ -421,43 +565,41 @@ class Faker:
     match_Float8 = match_float
 
     def make_int(self, spec):
-        return randrange(-(1 << 90), 1 << 90)
+        return getrandbits(91) - (1 << 90)
 
     def make_Int2(self, spec):
-        return spec(randrange(-(1 << 15), 1 << 15))
+        return spec(getrandbits(16) - (1 << 15))
 
     def make_Int4(self, spec):
-        return spec(randrange(-(1 << 31), 1 << 31))
+        return spec(getrandbits(32) - (1 << 31))
 
     def make_Int8(self, spec):
-        return spec(randrange(-(1 << 63), 1 << 63))
+        return spec(getrandbits(64) - (1 << 63))
 
     def make_IntNumeric(self, spec):
-        return spec(randrange(-(1 << 100), 1 << 100))
+        return spec(getrandbits(101) - (1 << 100))
 
     def make_IPv4Address(self, spec):
-        return ipaddress.IPv4Address(bytes(randrange(256) for _ in range(4)))
+        return ipaddress.IPv4Address(randbytes(4))
 
     def make_IPv4Interface(self, spec):
         prefix = randrange(32)
-        return ipaddress.IPv4Interface(
-            (bytes(randrange(256) for _ in range(4)), prefix)
-        )
+        return ipaddress.IPv4Interface((randbytes(4), prefix))
 
     def make_IPv4Network(self, spec):
-        return self.make_IPv4Interface(spec).network
+        prefix = randrange(32)
+        return ipaddress.IPv4Network((randbytes(4), prefix), strict=False)
 
     def make_IPv6Address(self, spec):
-        return ipaddress.IPv6Address(bytes(randrange(256) for _ in range(16)))
+        return ipaddress.IPv6Address(randbytes(16))
 
     def make_IPv6Interface(self, spec):
         prefix = randrange(128)
-        return ipaddress.IPv6Interface(
-            (bytes(randrange(256) for _ in range(16)), prefix)
-        )
+        return ipaddress.IPv6Interface((randbytes(16), prefix))
 
     def make_IPv6Network(self, spec):
-        return self.make_IPv6Interface(spec).network
+        prefix = randrange(128)
+        return ipaddress.IPv6Network((randbytes(16), prefix), strict=False)
 
     def make_Json(self, spec):
         return spec(self._make_json())
@@ -643,38 +785,39 @@ class Faker:
             return spec[0](empty=True)
 
         while True:
-            bounds: List[Union[Any, None]] = []
-            while len(bounds) < 2:
-                if random() < no_bound_chance:
-                    bounds.append(None)
-                    continue
-
-                val = self.make(spec[1])
-                # NaN are allowed in a range, but comparison in Python get tricky.
-                if spec[1] is Decimal and val.is_nan():
-                    continue
-
-                bounds.append(val)
-
-            if bounds[0] is not None and bounds[1] is not None:
-                if bounds[0] == bounds[1]:
-                    # It would come out empty
-                    continue
-
-                if bounds[0] > bounds[1]:
-                    bounds.reverse()
-
-            # avoid generating ranges with no type info if dumping in binary
-            # TODO: lift this limitation after test_copy_in_empty xfail is fixed
-            if spec[0] is Range and self.format == PyFormat.BINARY:
-                if bounds[0] is bounds[1] is None:
+            lower = self._make_bound(spec[1], no_bound_chance)
+            upper = self._make_bound(spec[1], no_bound_chance)
+
+            if lower is None or upper is None:
+                # avoid generating ranges with no type info if dumping in binary
+                # TODO: lift this limitation after test_copy_in_empty xfail is fixed
+                if (
+                    lower is upper
+                    and spec[0] is Range
+                    and self.format == PyFormat.BINARY
+                ):
                     continue
+            elif lower == upper:
+                # It would come out empty
+                continue
+            elif lower > upper:
+                lower, upper = upper, lower
 
             break
 
-        r = spec[0](bounds[0], bounds[1], choice("[(") + choice("])"))
+        r = spec[0](lower, upper, choice("[(") + choice("])"))
         return r
 
+    def _make_bound(self, spec, no_bound_chance):
+        if random() < no_bound_chance:
+            return None
+
+        while True:
+            val = self.make(spec)
+            # NaN are allowed in a range, but comparison in Python get tricky.
+            if not (spec is Decimal and val.is_nan()):
+                return val
+
     def example_Range(self, spec):
         return self.make_Range(spec, empty_chance=0, no_bound_chance=0)
 
@@ -757,13 +900,17 @@ class Faker:
         if not length:
             length = randrange(self.str_max_length)
 
-        rv: List[int] = []
-        while len(rv) < length:
-            c = randrange(1, 128) if random() < 0.5 else randrange(1, 0x110000)
-            if not (0xD800 <= c <= 0xDBFF or 0xDC00 <= c <= 0xDFFF):
-                rv.append(c)
-
-        return "".join(map(chr, rv))
+        # Pick each char as ASCII or as any Unicode char with the same chance.
+        # The Unicode pool is 0x800 values shorter: the codepoints from
+        # 0xD800 up are shifted past the surrogates.
+        asciis = choices(range(1, 0x80), k=length)
+        unis = choices(range(1, 0x110000 - 0x800), k=length)
+        return "".join(
+            [
+                chr(a if random() < 0.5 else u if u < 0xD800 else u + 0x800)
+                for a, u in zip(asciis, unis)
+            ]
+        )
 
     def schema_time(self, cls):
         # Choose timezone yes/no
@@ -778,7 +925,7 @@ class Faker:
         return dt.time(h, m, s, ms, tz)
 
     def make_timedelta(self, spec):
-        return choice([dt.timedelta.min, dt.timedelta.max]) * random()
+        return choice(_TIMEDELTA_BOUNDS) * random()
 
     def schema_tuple(self, cls):
         # TODO: this is a complicated matter as it would involve creating
@@ -800,51 +947,60 @@ class Faker:
                 m(s, g, w)
 
     def make_UUID(self, spec):
-        return UUID(bytes=bytes([randrange(256) for i in range(16)]))
+        return UUID(bytes=randbytes(16))
 
-    def _make_json(self, container_chance=0.66):
-        rec_types = [list, dict]
-        scal_types = [type(None), int, JsonFloat, bool, str]
-        if random() < container_chance:
-            cls = choice(rec_types)
+    def _make_json(self, level=0):
+        if (
+            level < self.json_max_level
+            and random() < _JSON_CONTAINER_CHANCE / (1 << level)
+        ):
+            cls = choice(_JSON_REC_TYPES)
+            make_json = self._make_json
+            level += 1
             if cls is list:
                 return [
-                    self._make_json(container_chance=container_chance / 2.0)
+                    make_json(level)
                     for i in range(randrange(self.json_max_length))
                 ]
             elif cls is dict:
+                make_str = self.make_str
                 return {
-                    self.make_str(str, 15): self._make_json(
-                        container_chance=container_chance / 2.0
-                    )
+                    make_str(str, 15): make_json(level)
                     for i in range(randrange(self.json_max_length))
                 }
             else:
                 assert False, f"unknown rec type: {cls}"
 
         else:
-            cls = choice(scal_types)  # type: ignore[assignment]
+            cls = choice(_JSON_SCAL_TYPES)
             return self.make(cls)
 
     def _make_tz(self, spec):
-        minutes = randrange(-12 * 60, 12 * 60 + 1)
-        return dt.timezone(dt.timedelta(minutes=minutes))
+        return choice(_TIMEZONES)
 
 
 class JsonFloat:
     pass
 
 
+_JSON_REC_TYPES: Tuple[type, ...] = (list, dict)
+_JSON_SCAL_TYPES: Tuple[type, ...] = (type(None), int, JsonFloat, bool, str)
+
+# Chance for a top level json value to be a container, halved at every level
+_JSON_CONTAINER_CHANCE = 0.66
+
+
+def randbytes(n):
+    # Like random.randbytes(), which is only available from Python 3.9
+    return getrandbits(8 * n).to_bytes(n, "little") if n else b""
+
+
+@lru_cache(maxsize=None)
 def deep_import(name):
-    parts = Deque(name.split("."))
-    seen = []
-    if not parts:
-        raise ValueError("name must be a dot-separated name")
-
-    seen.append(parts.popleft())
-    thing = importlib.import_module(seen[-1])
-    while parts:
-        attr = parts.popleft()
+    parts = name.split(".")
+    seen = [parts[0]]
+    thing = importlib.import_module(parts[0])
+    for attr in parts[1:]:
         seen.append(attr)
 
         if hasattr(thing, attr):
@@ -455,8 +455,7 @@ def test_random(conn, faker, fmt, fmt_out):
     with conn.cursor(binary=fmt_out) as cur:
         cur.execute(faker.drop_stmt)
         cur.execute(faker.create_stmt)
-        with faker.find_insert_problem(conn):
-            cur.executemany(faker.insert_stmt, faker.records)
+        faker.bulk_insert(cur)
 
         cur.execute(faker.select_stmt)
         recs = cur.fetchall()
@@ -557,8 +557,7 @@ def test_copy_to_leaks(dsn, faker, fmt, set_types, method, retries):
             with conn.cursor(binary=fmt) as cur:
                 cur.execute(faker.drop_stmt)
                 cur.execute(faker.create_stmt)
-                with faker.find_insert_problem(conn):
-                    cur.executemany(faker.insert_stmt, faker.records)
+                faker.bulk_insert(cur)
 
                 stmt = sql.SQL(
                     "copy (select {} from {} order by id) to stdout (format {})"
@@ -616,17 +615,7 @@ def test_copy_from_leaks(dsn, faker, fmt, set_types, retries):
             with conn.cursor(binary=fmt) as cur:
                 cur.execute(faker.drop_stmt)
                 cur.execute(faker.create_stmt)
-
-                stmt = sql.SQL("copy {} ({}) from stdin (format {})").format(
-                    faker.table_name,
-                    sql.SQL(", ").join(faker.fields_names),
-                    sql.SQL(fmt.name),
-                )
-                with cur.copy(stmt) as copy:
-                    if set_types:
-                        copy.set_types(faker.types_names)
-                    for row in faker.records:
-                        copy.write_row(row)
+                faker.copy_insert(cur, set_types=set_types)
 
                 cur.execute(faker.select_stmt)
                 recs = cur.fetchall()
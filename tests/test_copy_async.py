@@ -549,8 +549,7 @@ async def test_copy_to_leaks(dsn, faker, fmt, set_types, method, retries):
             async with conn.cursor(binary=fmt) as cur:
                 await cur.execute(faker.drop_stmt)
                 await cur.execute(faker.create_stmt)
-                async with faker.find_insert_problem_async(conn):
-                    await cur.executemany(faker.insert_stmt, faker.records)
+                await faker.bulk_insert_async(cur)
 
                 stmt = sql.SQL(
                     "copy (select {} from {} order by id) to stdout (format {})"
@@ -608,17 +607,7 @@ async def test_copy_from_leaks(dsn, faker, fmt, set_types, retries):
             async with conn.cursor(binary=fmt) as cur:
                 await cur.execute(faker.drop_stmt)
                 await cur.execute(faker.create_stmt)
-
-                stmt = sql.SQL("copy {} ({}) from stdin (format {})").format(
-                    faker.table_name,
-                    sql.SQL(", ").join(faker.fields_names),
-                    sql.SQL(fmt.name),
-                )
-                async with cur.copy(stmt) as copy:
-                    if set_types:
-                        copy.set_types(faker.types_names)
-                    for row in faker.records:
-                        await copy.write_row(row)
+                await faker.copy_insert_async(cur, set_types=set_types)
 
                 await cur.execute(faker.select_stmt)
                 recs = await cur.fetchall()
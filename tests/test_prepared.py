@@ -7,10 +7,13 @@ from decimal import Decimal
 
 import pytest
 
+from psycopg import errors as e
+
 
 def test_connection_attributes(conn, monkeypatch):
     assert conn.prepare_threshold == 5
     assert conn.prepared_max == 100
+    assert conn.prepared_max_bytes == 8 * 1024 * 1024
 
     # They are on the class
     monkeypatch.setattr(conn.__class__, "prepare_threshold", 10)
@@ -81,6 +84,17 @@ def test_prepare_disable(conn):
     assert not conn._prepared._counts
 
 
+def test_prepare_disable_enable(conn):
+    conn.prepare_threshold = None
+    conn.execute("select 1", prepare=True)
+    conn.prepare_threshold = 0
+    conn.execute("select 2")
+    cur = conn.execute(
+        "select statement from pg_prepared_statements", prepare=False
+    )
+    assert cur.fetchall() == [("select 2",)]
+
+
 def test_no_prepare_multi(conn):
     res = []
     for i in range(10):
@@ -179,6 +193,92 @@ def test_evict_lru_deallocate(conn):
     assert cur.fetchall() == [(f"select {i}",) for i in ["'a'", 6, 7, 8, 9]]
 
 
+def test_evict_lfu(conn):
+    conn.prepared_max = 8
+    conn.prepare_threshold = 0
+    for i in range(5):
+        conn.execute("select 'a'")
+    for i in range(8):
+        conn.execute(f"select {i}")
+
+    # 'a' is the least recently used, but it was used more than the others
+    assert len(conn._prepared._names) == 8
+    assert (b"select 'a'", ()) in conn._prepared._names
+    assert (b"select 0", ()) not in conn._prepared._names
+
+    cur = conn.execute(
+        "select statement from pg_prepared_statements order by prepare_time",
+        prepare=False,
+    )
+    assert cur.fetchall() == [(f"select {i}",) for i in ["'a'", *range(1, 8)]]
+
+
+def test_evict_bytes(conn):
+    conn.prepared_max_bytes = 30
+    conn.prepare_threshold = 0
+    for i in range(100, 104):
+        conn.execute(f"select {i}")
+    conn.execute("select 'a long query which is never prepared'")
+
+    assert len(conn._prepared._names) == 3
+    assert conn._prepared._total_bytes == 30
+
+    cur = conn.execute(
+        "select statement from pg_prepared_statements order by prepare_time",
+        prepare=False,
+    )
+    assert cur.fetchall() == [(f"select {i}",) for i in range(101, 104)]
+
+
+def test_evict_batch(conn, monkeypatch):
+    conn.prepare_threshold = 0
+    for i in range(100, 104):
+        conn.execute(f"select {i}")
+
+    commands = []
+    exec_command = conn._exec_command
+
+    def _exec_command(command, *args, **kwargs):
+        commands.append(command)
+        return exec_command(command, *args, **kwargs)
+
+    monkeypatch.setattr(conn, "_exec_command", _exec_command)
+    conn.prepared_max_bytes = 10
+    conn.execute("select 'a'")
+
+    assert len(commands) == 1
+    assert commands[0].count(b"DEALLOCATE ") == 4
+    cur = conn.execute(
+        "select statement from pg_prepared_statements", prepare=False
+    )
+    assert cur.fetchall() == [("select 'a'",)]
+
+
+def test_evict_batch_failed(conn):
+    conn.autocommit = True
+    conn.prepare_threshold = 0
+    for i in range(100, 104):
+        conn.execute(f"select {i}")
+
+    # Deallocate a statement behind our back: the batch fails on it
+    name = list(conn._prepared._names.values())[1]
+    conn.execute(f"deallocate {name.decode()}", prepare=False)
+
+    conn.prepared_max_bytes = 10
+    with pytest.raises(e.InvalidSqlStatementName):
+        conn.execute("select 'a'")
+
+    # The failed batch is not sent again
+    assert not conn._prepared._maint_commands
+    conn.execute("select 'a'")
+    cur = conn.execute(
+        "select statement from pg_prepared_statements"
+        " where statement = 'select 100'",
+        prepare=False,
+    )
+    assert cur.fetchall() == []
+
+
 def test_different_types(conn):
     conn.prepare_threshold = 0
     conn.execute("select %s", [None])
@@ -7,12 +7,15 @@ from decimal import Decimal
 
 import pytest
 
+from psycopg import errors as e
+
 pytestmark = pytest.mark.asyncio
 
 
 async def test_connection_attributes(aconn, monkeypatch):
     assert aconn.prepare_threshold == 5
     assert aconn.prepared_max == 100
+    assert aconn.prepared_max_bytes == 8 * 1024 * 1024
 
     # They are on the class
     monkeypatch.setattr(aconn.__class__, "prepare_threshold", 10)
@@ -87,6 +90,17 @@ async def test_prepare_disable(aconn):
     assert not aconn._prepared._counts
 
 
+async def test_prepare_disable_enable(aconn):
+    aconn.prepare_threshold = None
+    await aconn.execute("select 1", prepare=True)
+    aconn.prepare_threshold = 0
+    await aconn.execute("select 2")
+    cur = await aconn.execute(
+        "select statement from pg_prepared_statements", prepare=False
+    )
+    assert await cur.fetchall() == [("select 2",)]
+
+
 async def test_no_prepare_multi(aconn):
     res = []
     for i in range(10):
@@ -179,6 +193,94 @@ async def test_evict_lru_deallocate(aconn):
     ]
 
 
+async def test_evict_lfu(aconn):
+    aconn.prepared_max = 8
+    aconn.prepare_threshold = 0
+    for i in range(5):
+        await aconn.execute("select 'a'")
+    for i in range(8):
+        await aconn.execute(f"select {i}")
+
+    # 'a' is the least recently used, but it was used more than the others
+    assert len(aconn._prepared._names) == 8
+    assert (b"select 'a'", ()) in aconn._prepared._names
+    assert (b"select 0", ()) not in aconn._prepared._names
+
+    cur = await aconn.execute(
+        "select statement from pg_prepared_statements order by prepare_time",
+        prepare=False,
+    )
+    assert await cur.fetchall() == [
+        (f"select {i}",) for i in ["'a'", *range(1, 8)]
+    ]
+
+
+async def test_evict_bytes(aconn):
+    aconn.prepared_max_bytes = 30
+    aconn.prepare_threshold = 0
+    for i in range(100, 104):
+        await aconn.execute(f"select {i}")
+    await aconn.execute("select 'a long query which is never prepared'")
+
+    assert len(aconn._prepared._names) == 3
+    assert aconn._prepared._total_bytes == 30
+
+    cur = await aconn.execute(
+        "select statement from pg_prepared_statements order by prepare_time",
+        prepare=False,
+    )
+    assert await cur.fetchall() == [(f"select {i}",) for i in range(101, 104)]
+
+
+async def test_evict_batch(aconn, monkeypatch):
+    aconn.prepare_threshold = 0
+    for i in range(100, 104):
+        await aconn.execute(f"select {i}")
+
+    commands = []
+    exec_command = aconn._exec_command
+
+    def _exec_command(command, *args, **kwargs):
+        commands.append(command)
+        return exec_command(command, *args, **kwargs)
+
+    monkeypatch.setattr(aconn, "_exec_command", _exec_command)
+    aconn.prepared_max_bytes = 10
+    await aconn.execute("select 'a'")
+
+    assert len(commands) == 1
+    assert commands[0].count(b"DEALLOCATE ") == 4
+    cur = await aconn.execute(
+        "select statement from pg_prepared_statements", prepare=False
+    )
+    assert await cur.fetchall() == [("select 'a'",)]
+
+
+async def test_evict_batch_failed(aconn):
+    await aconn.set_autocommit(True)
+    aconn.prepare_threshold = 0
+    for i in range(100, 104):
+        await aconn.execute(f"select {i}")
+
+    # Deallocate a statement behind our back: the batch fails on it
+    name = list(aconn._prepared._names.values())[1]
+    await aconn.execute(f"deallocate {name.decode()}", prepare=False)
+
+    aconn.prepared_max_bytes = 10
+    with pytest.raises(e.InvalidSqlStatementName):
+        await aconn.execute("select 'a'")
+
+    # The failed batch is not sent again
+    assert not aconn._prepared._maint_commands
+    await aconn.execute("select 'a'")
+    cur = await aconn.execute(
+        "select statement from pg_prepared_statements"
+        " where statement = 'select 100'",
+        prepare=False,
+    )
+    assert await cur.fetchall() == []
+
+
 async def test_different_types(aconn):
     aconn.prepare_threshold = 0
     await aconn.execute("select %s", [None])
@@ -118,6 +118,35 @@ def test_dump_utf8_badenc(conn, fmt_in):
         cur.execute(f"select %{fmt_in}", ("\uddf8",))
 
 
+@pytest.mark.parametrize("encoding", ["utf8", "latin9"])
+@pytest.mark.parametrize(
+    "dumper_name", ["StrBinaryDumper", "StrDumper", "StrDumperUnknown"]
+)
+def test_dump_specialised(conn, encoding, dumper_name):
+    from psycopg.types import string
+
+    conn.execute(f"set client_encoding to {encoding}")
+    dumper = getattr(string, dumper_name)(str, conn)
+    assert "dump" in dumper.__dict__
+    assert dumper.dump(f"hello{eur}") == f"hello{eur}".encode(dumper._encoding)
+
+
+@pytest.mark.parametrize("encoding", ["utf8", "latin9"])
+def test_dump_subclass_not_specialised(conn, encoding):
+    from psycopg.types.string import StrDumper
+
+    class MyStrDumper(StrDumper):
+        def dump(self, obj):
+            return super().dump(obj.upper())
+
+    conn.execute(f"set client_encoding to {encoding}")
+    dumper = MyStrDumper(str, conn)
+    assert "dump" not in dumper.__dict__
+    assert dumper.dump(f"hello{eur}") == f"HELLO{eur}".encode(dumper._encoding)
+    with pytest.raises(psycopg.DataError):
+        dumper.dump("foo\x00bar")
+
+
 @pytest.mark.parametrize("fmt_in", [PyFormat.AUTO, PyFormat.TEXT])
 def test_dump_enum(conn, fmt_in):
     from enum import Enum
@@ -203,6 +232,36 @@ def test_load_ascii(conn, typename, fmt_out):
     assert res == eur.encode()
 
 
+@pytest.mark.parametrize("encoding", ["utf8", "latin9", "sql_ascii"])
+@pytest.mark.parametrize("loader_name", ["TextLoader", "TextBinaryLoader"])
+def test_load_specialised(conn, encoding, loader_name):
+    from psycopg.types import string
+
+    conn.execute(f"set client_encoding to {encoding}")
+    loader = getattr(string, loader_name)(0, conn)
+    assert "load" in loader.__dict__
+    data = f"hello{eur}".encode(loader._encoding or "utf8")
+    want = f"hello{eur}" if loader._encoding else data
+    assert loader.load(data) == want
+    assert loader.load(memoryview(data)) == want
+
+
+@pytest.mark.parametrize("encoding", ["utf8", "latin9"])
+def test_load_subclass_not_specialised(conn, encoding):
+    from psycopg.types.string import TextLoader
+
+    class MyTextLoader(TextLoader):
+        def load(self, data):
+            return super().load(data).upper()
+
+    conn.execute(f"set client_encoding to {encoding}")
+    loader = MyTextLoader(0, conn)
+    assert "load" not in loader.__dict__
+    data = f"hello{eur}".encode(loader._encoding)
+    assert loader.load(data) == f"HELLO{eur}"
+    assert loader.load(memoryview(data)) == f"HELLO{eur}"
+
+
 @pytest.mark.parametrize("fmt_in", PyFormat)
 @pytest.mark.parametrize("fmt_out", pq.Format)
 @pytest.mark.parametrize("typename", ["text", "varchar", "name", "bpchar"])